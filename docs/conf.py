@@ -308,4 +308,4 @@ thebe_config = {
     "repository_url": html_theme_options["repository_url"],
     "repository_branch": html_theme_options["repository_branch"],
 }
-version = get_package_version(PACKAGE)
+version = release
@@ -17,7 +17,7 @@ import sys
 from collections import abc
 from difflib import get_close_matches
 from fractions import Fraction
-from functools import total_ordering
+from functools import lru_cache, total_ordering
 from math import copysign
 from typing import TYPE_CHECKING, Any, Callable, SupportsFloat
 
@@ -248,6 +248,7 @@ class Particle:
             p.text(")")
 
 
+@lru_cache(maxsize=1024)
 def _get_name_root(name: str) -> str:
     """Strip a string (particularly the `.Particle.name`) of specifications."""
     name_root = name
@@ -288,13 +289,10 @@ class ParticleCollection(abc.MutableSet):  # noqa: PLW1641
         if particle_name in self.__particles:
             return self.__particles[particle_name]
         error_message = f"No particle with name '{particle_name}' in the database"
-        candidates = [
-            p.name
-            for p in sorted(self, key=lambda p: p.mass)
-            if p.name.startswith(particle_name)
-        ]
+        matches = (p for p in self if p.name.startswith(particle_name))
+        candidates = [p.name for p in sorted(matches, key=lambda p: p.mass)]
         if not candidates:
-            candidates = get_close_matches(particle_name, self.names, n=5)
+            candidates = get_close_matches(particle_name, self.__particles, n=5)
         if len(candidates) == 1:
             error_message += f". Did you mean '{candidates[0]}'?"
         elif len(candidates) > 1:
@@ -55,22 +55,17 @@ def test_id_to_particle_mappings(particle_database):
     )
     assert len(reaction.group_by_topology()) == 1
     assert len(reaction.transitions) == 4
-    iter_transitions = iter(reaction.transitions)
-    first_transition = next(iter_transitions)
-    graph = first_transition.convert(
-        lambda s: (s.particle, s.spin_projection)
-    ).unfreeze()
-    ref_mapping_fs = _create_edge_id_particle_mapping(
-        graph, graph.topology.outgoing_edge_ids
-    )
-    ref_mapping_is = _create_edge_id_particle_mapping(
-        graph, graph.topology.incoming_edge_ids
-    )
-    for transition in iter_transitions:
-        graph = transition.convert(lambda s: (s.particle, s.spin_projection)).unfreeze()
-        assert ref_mapping_fs == _create_edge_id_particle_mapping(
-            graph, graph.topology.outgoing_edge_ids
-        )
-        assert ref_mapping_is == _create_edge_id_particle_mapping(
-            graph, graph.topology.incoming_edge_ids
-        )
+    graphs = [
+        transition.convert(lambda s: (s.particle, s.spin_projection)).unfreeze()
+        for transition in reaction.transitions
+    ]
+    fs_mappings = [
+        _create_edge_id_particle_mapping(graph, graph.topology.outgoing_edge_ids)
+        for graph in graphs
+    ]
+    is_mappings = [
+        _create_edge_id_particle_mapping(graph, graph.topology.incoming_edge_ids)
+        for graph in graphs
+    ]
+    assert all(mapping == fs_mappings[0] for mapping in fs_mappings)
+    assert all(mapping == is_mappings[0] for mapping in is_mappings)
@@ -1,3 +1,4 @@
+from functools import cache
 from importlib.metadata import version
 
 import pytest
@@ -11,9 +12,14 @@ from qrules.settings import NumberOfThreads
 NumberOfThreads.set(1)
 
 
+@cache
+def _load_particle_database() -> ParticleCollection:
+    return load_default_particles()
+
+
 @pytest.fixture(scope="session")
 def particle_database() -> ParticleCollection:
-    return load_default_particles()
+    return _load_particle_database()
 
 
 @pytest.fixture(scope="session")
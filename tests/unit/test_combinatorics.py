@@ -198,8 +198,16 @@ class TestKinematicRepresentation:
             initial_state=[["J/psi"]],
             final_state=[["gamma", "pi0"], ["gamma", "pi0", "pi0"]],
         )
-        constructed_from_repr = eval(str(kinematic_representation))
-        assert constructed_from_repr == kinematic_representation
+        assert str(kinematic_representation) == (
+            "_KinematicRepresentation("
+            "initial_state=[['J/psi']], "
+            "final_state=[['gamma', 'pi0'], ['gamma', 'pi0', 'pi0']])"
+        )
+        constructed = _KinematicRepresentation(
+            initial_state=[["J/psi"]],
+            final_state=[["pi0", "gamma"], ["pi0", "pi0", "gamma"]],
+        )
+        assert constructed == kinematic_representation
 
     def test_in_operator(self):
         kinematic_representation = _KinematicRepresentation(
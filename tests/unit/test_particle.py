@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import logging
-from copy import deepcopy
+import re
+from ast import literal_eval
+from collections import defaultdict
+from copy import copy, deepcopy
 from fractions import Fraction
 from importlib.metadata import version
+from typing import TYPE_CHECKING, Any, Callable
 
 import pytest
 from attrs.exceptions import FrozenInstanceError
-from IPython.lib.pretty import pretty
 
 from qrules.particle import (
     Particle,
@@ -22,22 +25,106 @@ from qrules.particle import (
 from qrules.quantum_numbers import (
     Parity,  # noqa: F401 # pyright: ignore[reportUnusedImport]
 )
+from tests.conftest import _load_particle_database
+
+if TYPE_CHECKING:
+    from _pytest.fixtures import SubRequest
+
+_F0_MESON_NAMES = frozenset({
+    "f(0)(500)",
+    "f(0)(980)",
+    "f(0)(1370)",
+    "f(0)(1500)",
+    "f(0)(1710)",
+})
+_F0_MESON_NAMES_POST_0_22 = _F0_MESON_NAMES | {"f(0)(2020)"}
+
+_DID_YOU_MEAN = re.compile(r"Did you mean (?:one of these\? )?(.*?)\??\Z", re.DOTALL)
+
+_EXPECTED_NAME_ROOTS = frozenset({
+    "a",
+    "B",
+    "b",
+    "chi",
+    "D",
+    "Delta",
+    "e",
+    "eta",
+    "f",
+    "g",
+    "gamma",
+    "h",
+    "J/psi",
+    "K",
+    "Lambda",
+    "mu",
+    "N",
+    "n",
+    "nu",
+    "Omega",
+    "omega",
+    "p",
+    "phi",
+    "pi",
+    "psi",
+    "rho",
+    "Sigma",
+    "tau",
+    "Upsilon",
+    "W",
+    "Xi",
+    "Y",
+    "Z",
+})
+
+_SPIN_ERR_PATTERN = "|".join([  # noqa: FLY002
+    r"Spin magnitude \d+/\d+ has to be a multitude of \d\.[05]",
+    r"\(projection - magnitude\) should be integer",
+    r"Spin magnitude has to be positive",
+    r"Absolute value of spin projection cannot be larger than the magnitude",
+])
+
+
+@pytest.fixture(params=["repr", "pretty"])
+def repr_method(request: SubRequest) -> Callable[[Any], str]:
+    if request.param == "pretty":
+        from IPython.lib.pretty import pretty  # noqa: PLC0415
+
+        return pretty
+    return repr
+
+
+@pytest.fixture
+def mutable_pdg(particle_database: ParticleCollection) -> ParticleCollection:
+    """Private copy of the session-scoped `particle_database` for in-place edits."""
+    return deepcopy(particle_database)
+
+
+@pytest.fixture(scope="session")
+def particles_by_prefix(
+    particle_database: ParticleCollection,
+) -> dict[str, tuple[Particle, ...]]:
+    """Subsets of `particle_database` for the name prefixes used in this module."""
+    return {
+        prefix: tuple(p for p in particle_database if p.name.startswith(prefix))
+        for prefix in ("f(0)", "omega", "pi")
+    }
 
 
-def gen_namespace_with_fraction():
-    namespace = globals()
-    namespace["Fraction"] = Fraction
-    return namespace
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    if "tilde_name" in metafunc.fixturenames:
+        anti_particle_names = sorted(
+            p.name for p in _load_particle_database() if "~" in p.name
+        )
+        metafunc.parametrize("tilde_name", anti_particle_names)
 
 
 class TestParticle:
-    @pytest.mark.parametrize("repr_method", [repr, pretty])
     def test_repr(self, particle_database: ParticleCollection, repr_method):
-        local_namespace = locals()
-        local_namespace["Fraction"] = Fraction
-        for instance in particle_database:
-            from_repr = eval(repr_method(instance), None, gen_namespace_with_fraction())
-            assert from_repr == instance
+        instances = list(particle_database)
+        source = "[" + ",".join(repr_method(p) for p in instances) + "]"
+        from_repr = eval(source)
+        assert from_repr == instances
 
     @pytest.mark.parametrize(
         ("name", "is_lepton"),
@@ -95,7 +182,7 @@ class TestParticle:
         assert particle != Particle(
             name="MyParticle", pid=123, mass=1.5, width=0.2, spin=1
         )
-        same_particle = deepcopy(particle)
+        same_particle = copy(particle)
         assert particle is not same_particle
         assert particle == same_particle
         assert hash(particle) == hash(same_particle)
@@ -133,28 +220,20 @@ class TestParticle:
         assert pdg[name1] > pdg[name2]
 
     def test_neg(
-        self, particle_database: ParticleCollection, skh_particle_version: str
+        self,
+        particle_database: ParticleCollection,
+        particles_by_prefix: dict[str, tuple[Particle, ...]],
+        skh_particle_version: str,
     ):
         pip = particle_database.find(211)
         pim = particle_database.find(-211)
         assert pip == -pim
 
-        pdg = particle_database
-        f0_mesons = sorted(
-            particle.name
-            for particle in sorted(pdg.filter(lambda p: p.name.startswith("f(0)")))
-        )
-        expected = {
-            "f(0)(500)",
-            "f(0)(980)",
-            "f(0)(1370)",
-            "f(0)(1500)",
-            "f(0)(1710)",
-        }
+        f0_mesons = {particle.name for particle in particles_by_prefix["f(0)"]}
         if skh_particle_version > "0.22":
-            expected.add("f(0)(2020)")
-        sorted_expected = sorted(expected)
-        assert f0_mesons == sorted_expected
+            assert f0_mesons == _F0_MESON_NAMES_POST_0_22
+        else:
+            assert f0_mesons == _F0_MESON_NAMES
 
 
 def _get_omega_mesons() -> list[str]:
@@ -177,17 +256,18 @@ class TestParticleCollection:
         with pytest.raises(NotImplementedError):
             assert particle_database == 0
 
-    @pytest.mark.parametrize("repr_method", [repr, pretty])
     def test_repr(self, particle_database: ParticleCollection, repr_method):
         instance = particle_database
-        local_namespace = locals()
-        local_namespace["Fraction"] = Fraction
-        from_repr = eval(repr_method(instance), None, gen_namespace_with_fraction())
+        from_repr = eval(repr_method(instance))
         assert from_repr == instance
 
-    def test_add(self, particle_database: ParticleCollection):
-        subset_copy = particle_database.filter(lambda p: p.name.startswith("omega"))
-        subset_copy += particle_database.filter(lambda p: p.name.startswith("pi"))
+    def test_add(
+        self,
+        particle_database: ParticleCollection,
+        particles_by_prefix: dict[str, tuple[Particle, ...]],
+    ):
+        subset_copy = ParticleCollection(particles_by_prefix["omega"])
+        subset_copy += ParticleCollection(particles_by_prefix["pi"])
         n_subset = len(subset_copy)
 
         new_particle = create_particle(
@@ -201,8 +281,10 @@ class TestParticleCollection:
         assert len(subset_copy) == n_subset + 1
         assert subset_copy["EpEm"] is new_particle
 
-    def test_add_warnings(self, particle_database: ParticleCollection, caplog):
-        pions = particle_database.filter(lambda p: p.name.startswith("pi"))
+    def test_add_warnings(
+        self, particles_by_prefix: dict[str, tuple[Particle, ...]], caplog
+    ):
+        pions = ParticleCollection(particles_by_prefix["pi"])
         pi_plus = pions["pi+"]
         caplog.clear()
         with caplog.at_level(logging.WARNING):
@@ -220,8 +302,8 @@ class TestParticleCollection:
         assert particle in particle_database
         assert particle.pid in particle_database
 
-    def test_discard(self, particle_database: ParticleCollection):
-        pions = particle_database.filter(lambda p: p.name.startswith("pi"))
+    def test_discard(self, particles_by_prefix: dict[str, tuple[Particle, ...]]):
+        pions = ParticleCollection(particles_by_prefix["pi"])
         n_pions = len(pions)
         pim = pions["pi-"]
         pip = pions["pi+"]
@@ -266,7 +348,6 @@ class TestParticleCollection:
             and p.spin == 2
             and p.strangeness == 1
         )
-        sorted_result = sorted(filtered_result.names)
         expected = {
             "K(2)(1820)+",
             "K(2)(1820)0",
@@ -277,8 +358,7 @@ class TestParticleCollection:
                 "K(2)*(1980)0",
             }
             expected.update(additional_particles)
-        sorted_expected = sorted(expected)
-        assert sorted_result == sorted_expected
+        assert set(filtered_result.names) == expected
 
     def test_find(self, particle_database: ParticleCollection):
         f2_1950 = particle_database.find(9050225)
@@ -312,28 +392,26 @@ class TestParticleCollection:
         with pytest.raises(LookupError) as exception:
             particle_database.find(search_term)
         if expected is not None:
-            message = str(exception.value.args[0])
-            list_str = message.strip("?")
-            *_, list_str = list_str.split("Did you mean ")
-            *_, list_str = list_str.split("one of these? ")
-            found_particles = eval(list_str, None, gen_namespace_with_fraction())
+            match = _DID_YOU_MEAN.search(str(exception.value.args[0]))
+            assert match is not None
+            found_particles = literal_eval(match.group(1))
             assert found_particles == expected
 
-    def test_exceptions(self, particle_database: ParticleCollection):
-        gamma = particle_database["gamma"]
+    def test_exceptions(self, mutable_pdg: ParticleCollection):
+        gamma = mutable_pdg["gamma"]
         with pytest.raises(
             ValueError,
             match=(
                 'Added particle "gamma_new" is equivalent to existing particle "gamma"'
             ),
         ):
-            particle_database += create_particle(gamma, name="gamma_new")
+            mutable_pdg += create_particle(gamma, name="gamma_new")
         with pytest.raises(NotImplementedError):
-            particle_database.find(3.12)  # type: ignore[arg-type]
+            mutable_pdg.find(3.12)  # type: ignore[arg-type]
         with pytest.raises(NotImplementedError):
-            particle_database += 3.12  # type: ignore[arg-type]
+            mutable_pdg += 3.12  # type: ignore[arg-type]
         with pytest.raises(NotImplementedError):
-            assert 3.12 in particle_database
+            assert 3.12 in mutable_pdg
         with pytest.raises(AssertionError):
             assert gamma == "gamma"
 
@@ -354,7 +432,7 @@ class TestSpin:
     def test_hash(self):
         spin1 = Spin(0.0, 0.0)
         spin2 = Spin(1.5, -0.5)
-        assert {spin2, spin1, deepcopy(spin1), deepcopy(spin2)} == {
+        assert {spin2, spin1, Spin(0.0, 0.0), Spin(1.5, -0.5)} == {
             spin1,
             spin2,
         }
@@ -376,12 +454,11 @@ class TestSpin:
         assert flipped_spin.magnitude == isospin.magnitude
         assert flipped_spin.projection == -isospin.projection
 
-    @pytest.mark.parametrize("repr_method", [repr, pretty])
     @pytest.mark.parametrize(
         "instance", [Spin(2.5, -0.5), Spin(1, 0), Spin(3, -1), Spin(0, 0)]
     )
     def test_repr(self, instance: Spin, repr_method):
-        from_repr = eval(repr_method(instance), None, gen_namespace_with_fraction())
+        from_repr = eval(repr_method(instance))
         assert from_repr == instance
 
     @pytest.mark.parametrize(
@@ -389,13 +466,7 @@ class TestSpin:
         [(0.3, 0.3), (1.0, 0.5), (0.5, 0.0), (-0.5, 0.5)],
     )
     def test_exceptions(self, magnitude, projection):
-        regex_pattern = "|".join([  # noqa: FLY002
-            r"Spin magnitude \d+/\d+ has to be a multitude of \d\.[05]",
-            r"\(projection - magnitude\) should be integer",
-            r"Spin magnitude has to be positive",
-            r"Absolute value of spin projection cannot be larger than the magnitude",
-        ])
-        with pytest.raises(ValueError, match=regex_pattern):
+        with pytest.raises(ValueError, match=_SPIN_ERR_PATTERN):
             print(Spin(magnitude, projection))
 
 
@@ -415,7 +486,7 @@ def test_create_antiparticle(
     assert anti_particle == comparison_particle
 
 
-def test_create_antiparticle_tilde(
+def test_number_of_tilde_antiparticles(
     particle_database: ParticleCollection, skh_particle_version: str
 ):
     anti_particles = particle_database.filter(lambda p: "~" in p.name)
@@ -427,30 +498,38 @@ def test_create_antiparticle_tilde(
         assert len(anti_particles) == 175
     else:
         assert len(anti_particles) == 176
-    for anti_particle in anti_particles:
-        particle_name = anti_particle.name.replace("~", "")
-        if "+" in particle_name:
-            particle_name = particle_name.replace("+", "-")
-        elif "-" in particle_name:
-            particle_name = particle_name.replace("-", "+")
-        created_particle = create_antiparticle(anti_particle, particle_name)
-        assert created_particle == particle_database[particle_name]
 
 
-def test_create_antiparticle_by_pid(
-    particle_database: ParticleCollection, skh_particle_version: str
+@pytest.mark.usefixtures("skh_particle_version")
+def test_create_antiparticle_tilde(
+    particle_database: ParticleCollection, tilde_name: str
 ):
-    n_particles_with_neg_pid = 0
+    anti_particle = particle_database[tilde_name]
+    particle_name = tilde_name.replace("~", "")
+    if "+" in particle_name:
+        particle_name = particle_name.replace("+", "-")
+    elif "-" in particle_name:
+        particle_name = particle_name.replace("-", "+")
+    created_particle = create_antiparticle(anti_particle, particle_name)
+    assert created_particle == particle_database[particle_name]
+
+
+def _get_particles_by_pid(
+    particle_database: ParticleCollection,
+) -> defaultdict[int, list[Particle]]:
+    particles_by_pid: defaultdict[int, list[Particle]] = defaultdict(list)
     for particle in particle_database:
-        anti_particles_by_pid = particle_database.filter(
-            lambda p: p.pid == -particle.pid  # noqa: B023
-        )
-        if len(anti_particles_by_pid) != 1:
-            continue
-        n_particles_with_neg_pid += 1
-        anti_particle = next(iter(anti_particles_by_pid))
-        particle_from_anti = -anti_particle
-        assert particle == particle_from_anti
+        particles_by_pid[particle.pid].append(particle)
+    return particles_by_pid
+
+
+def test_create_antiparticle_by_pid_count(
+    particle_database: ParticleCollection, skh_particle_version: str
+):
+    particles_by_pid = _get_particles_by_pid(particle_database)
+    n_particles_with_neg_pid = sum(
+        len(particles_by_pid.get(-p.pid, ())) == 1 for p in particle_database
+    )
     if skh_particle_version < "0.14":
         assert n_particles_with_neg_pid == 428
     elif skh_particle_version < "0.16":
@@ -461,6 +540,17 @@ def test_create_antiparticle_by_pid(
         assert n_particles_with_neg_pid == 456
 
 
+def test_create_antiparticle_by_pid(particle_database: ParticleCollection):
+    particles_by_pid = _get_particles_by_pid(particle_database)
+    for particle in particle_database:
+        candidates = particles_by_pid.get(-particle.pid, [])
+        if len(candidates) != 1:
+            continue
+        anti_particle = candidates[0]
+        particle_from_anti = -anti_particle
+        assert particle == particle_from_anti
+
+
 @pytest.mark.parametrize(
     "particle_name",
     ["p", "phi(1020)", "W-", "gamma"],
@@ -502,38 +592,4 @@ def test_create_particle_isospin():
 
 def test_get_name_root(particle_database: ParticleCollection):
     name_roots = {_get_name_root(p.name) for p in particle_database}
-    assert name_roots == {
-        "a",
-        "B",
-        "b",
-        "chi",
-        "D",
-        "Delta",
-        "e",
-        "eta",
-        "f",
-        "g",
-        "gamma",
-        "h",
-        "J/psi",
-        "K",
-        "Lambda",
-        "mu",
-        "N",
-        "n",
-        "nu",
-        "Omega",
-        "omega",
-        "p",
-        "phi",
-        "pi",
-        "psi",
-        "rho",
-        "Sigma",
-        "tau",
-        "Upsilon",
-        "W",
-        "Xi",
-        "Y",
-        "Z",
-    }
+    assert name_roots == _EXPECTED_NAME_ROOTS